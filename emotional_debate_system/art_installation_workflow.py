@@ -6,18 +6,18 @@ Complete workflow from visitor voice recording to emotional debate generation
 
 import os
 import sys
+import importlib.util
+import math
 import time
+import queue
 import tempfile
+import threading
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import Optional
 import warnings
 
 import sounddevice as sd
 import soundfile as sf
-import numpy as np
-import psutil
-
-from m1_optimized_voice import M1OptimizedVoiceAgent
 
 warnings.filterwarnings("ignore", category=UserWarning)
 
@@ -37,7 +37,9 @@ class ArtInstallationWorkflow:
         self.voice_agent = None
         self.visitor_voice_path = None
         self.debate_cache = {}
+        self._debate_audio = []  # Cached audio in statement order (None if not generated)
         self.session_id = None
+        self._preload_thread = None
         
         # Debate statements for emotional debate
         self.debate_statements = [
@@ -97,25 +99,48 @@ class ArtInstallationWorkflow:
         print("   Speak naturally and clearly about yourself or your thoughts.")
         
         try:
-            # Record audio
+            # Stream 16-bit PCM into the WAV as blocks arrive; the audio callback
+            # only queues a copy, the file is written from this thread
             print("🔴 Recording started...")
-            audio_data = sd.rec(
-                int(duration * 22050),  # frames
-                samplerate=22050,
-                channels=1,
-                dtype=np.float32
-            )
+            total_frames = int(duration * 22050)
+            recorded = 0
+            overflowed = False
+            blocks = queue.SimpleQueue()
+            
+            def on_audio(indata, frames, time_info, status):
+                nonlocal recorded, overflowed
+                if status.input_overflow:
+                    overflowed = True
+                n = min(frames, total_frames - recorded)
+                blocks.put(indata[:n].copy())
+                recorded += n
+                if recorded >= total_frames:
+                    raise sd.CallbackStop
             
-            # Simple countdown
-            for i in range(duration, 0, -1):
-                print(f"   {i}s remaining...", end='\r')
-                time.sleep(1)
+            with sf.SoundFile(self.visitor_voice_path, 'w', 22050, 1, 'PCM_16') as wav:
+                def write_blocks():
+                    while not blocks.empty():
+                        wav.write(blocks.get_nowait())
+                
+                with sd.InputStream(samplerate=22050, channels=1, dtype='int16',
+                                    callback=on_audio) as stream:
+                    # Simple countdown
+                    while stream.active:
+                        write_blocks()
+                        remaining = math.ceil((total_frames - recorded) / 22050)
+                        print(f"   {remaining}s remaining...", end='\r')
+                        time.sleep(0.1)
+                
+                write_blocks()
             
-            sd.wait()  # Wait for recording to complete
+            if overflowed:
+                print("\n⚠️  Input overflow: some of the voice sample was dropped")
+            if recorded == 0:
+                print("\n❌ No audio captured")
+                self._discard_voice_sample()
+                return False
             print("\n✅ Recording complete!")
             
-            # Save the audio
-            sf.write(self.visitor_voice_path, audio_data, 22050)
             print(f"💾 Voice sample saved: {self.visitor_voice_path}")
             
             # Verify the file
@@ -129,8 +154,17 @@ class ArtInstallationWorkflow:
                 
         except Exception as e:
             print(f"❌ Recording failed: {e}")
+            self._discard_voice_sample()
             return False
 
+    def _discard_voice_sample(self) -> None:
+        """Remove a partial voice sample left behind by a failed recording"""
+        try:
+            if self.visitor_voice_path and os.path.exists(self.visitor_voice_path):
+                os.remove(self.visitor_voice_path)
+        except OSError as e:
+            print(f"⚠️  Could not remove partial voice sample: {e}")
+
     def show_recording_instructions(self, duration: int):
         """Show instructions to the visitor before recording"""
         instructions = [
@@ -160,6 +194,21 @@ class ArtInstallationWorkflow:
         
         input()  # Wait for user to press Enter
 
+    def start_model_preload(self) -> None:
+        """Load the voice cloning model in the background while the visitor records"""
+        def _preload():
+            try:
+                from m1_optimized_voice import get_optimal_device
+                from shared_chatterbox import get_shared_model
+                
+                # Only load the weights; conditioning and warmup need the finished sample
+                get_shared_model(get_optimal_device())
+            except Exception as e:
+                print(f"⚠️  Background model load failed: {e}")
+        
+        self._preload_thread = threading.Thread(target=_preload, daemon=True)
+        self._preload_thread.start()
+
     def initialize_voice_cloning(self) -> bool:
         """Initialize the voice cloning system with recorded sample"""
         if not self.visitor_voice_path or not os.path.exists(self.visitor_voice_path):
@@ -168,7 +217,15 @@ class ArtInstallationWorkflow:
         
         print("🤖 Initializing voice cloning system...")
         
+        # Wait for the model loaded during recording, if one was started
+        if self._preload_thread is not None:
+            self._preload_thread.join()
+            self._preload_thread = None
+        
         try:
+            # Imported lazily so the visitor greeting isn't held up by torch/Chatterbox
+            from m1_optimized_voice import M1OptimizedVoiceAgent
+            
             # Initialize the M1 optimized voice agent
             self.voice_agent = M1OptimizedVoiceAgent(str(self.visitor_voice_path))
             
@@ -201,6 +258,9 @@ class ArtInstallationWorkflow:
                 str(self.visitor_voice_path)
             )
             
+            # Resolve the cache once so playback indexes a list, not the dict
+            self._debate_audio = [self.debate_cache.get(s) for s in self.debate_statements]
+            
             if len(self.debate_cache) > 0:
                 print(f"✅ Debate prepared! {len(self.debate_cache)} statements ready")
                 return True
@@ -224,13 +284,13 @@ class ArtInstallationWorkflow:
         print()
         
         try:
-            for i, statement in enumerate(self.debate_statements, 1):
+            for i, (statement, audio) in enumerate(zip(self.debate_statements, self._debate_audio), 1):
                 print(f"[{i:02d}/{len(self.debate_statements):02d}] 🗣️  \"{statement}\"")
                 
-                # Play pre-generated audio instantly
-                success = self.voice_agent.play_cached_statement(statement)
-                
-                if not success:
+                if audio is not None:
+                    # Play pre-generated audio instantly
+                    self.voice_agent.play_audio(audio, wait=False)
+                else:
                     # Fallback: generate in real-time if not cached
                     print("   ⚠️  Generating in real-time...")
                     try:
@@ -268,6 +328,8 @@ class ArtInstallationWorkflow:
                 print(f"   🗑️  Removed voice sample: {self.visitor_voice_path.name}")
             
             # Clear cached audio from memory
+            self.debate_cache = {}
+            self._debate_audio = []
             if self.voice_agent:
                 self.voice_agent.cleanup()
                 print("   💾 Cleared audio cache")
@@ -296,6 +358,9 @@ class ArtInstallationWorkflow:
             # Step 1: Setup session
             session_id = self.setup_session(visitor_name)
             
+            # Load the model while the visitor reads instructions and records
+            self.start_model_preload()
+            
             # Step 2: Record voice
             print(f"\n📍 Step 1: Voice Recording")
             if not self.record_voice_sample(recording_duration):
@@ -379,12 +444,9 @@ def main():
 
 
 if __name__ == "__main__":
-    # Check basic requirements
-    try:
-        import torch
-        if not torch.backends.mps.is_available():
-            print("⚠️  MPS not available. Performance may be reduced.")
-    except ImportError:
+    # Check basic requirements without importing torch up front; the MPS
+    # check happens when the voice agent picks its device
+    if importlib.util.find_spec("torch") is None:
         print("❌ PyTorch not found. Please run setup first:")
         print("   ./setup_m1_chatterbox.sh")
         sys.exit(1)
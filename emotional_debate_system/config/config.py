@@ -1,33 +1,38 @@
 import os
+from functools import lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
 from pydantic import BaseModel, Field
-from typing import Literal
 
 # Load environment variables
 load_dotenv()
 
+def _env_num(name: str, default, cast):
+    """Read a numeric env var, skipping the conversion when it is unset"""
+    value = os.getenv(name)
+    return default if value is None else cast(value)
+
 class LLMConfig(BaseModel):
     host: str = Field(default_factory=lambda: os.getenv('OLLAMA_HOST', 'http://localhost:11434'))
     model: str = Field(default_factory=lambda: os.getenv('OLLAMA_MODEL', 'llama3.1:8b'))
-    temperature: float = Field(default_factory=lambda: float(os.getenv('LLM_TEMPERATURE', '0.7')))
-    max_tokens: int = Field(default_factory=lambda: int(os.getenv('LLM_MAX_TOKENS', '150')))
+    temperature: float = Field(default_factory=lambda: _env_num('LLM_TEMPERATURE', 0.7, float))
+    max_tokens: int = Field(default_factory=lambda: _env_num('LLM_MAX_TOKENS', 150, int))
 
 class EmotionConfig(BaseModel):
     model: str = Field(default_factory=lambda: os.getenv('EMOTION_MODEL', 'SamLowe/roberta-base-go_emotions'))
-    threshold: float = Field(default_factory=lambda: float(os.getenv('EMOTION_THRESHOLD', '0.3')))
+    threshold: float = Field(default_factory=lambda: _env_num('EMOTION_THRESHOLD', 0.3, float))
     device: str = Field(default_factory=lambda: os.getenv('EMOTION_DEVICE', 'cpu'))
 
 class TTSConfig(BaseModel):
     engine: str = Field(default_factory=lambda: os.getenv('TTS_ENGINE', 'local'))
     model: str = Field(default_factory=lambda: os.getenv('TTS_MODEL', 'tts_models/en/ljspeech/tacotron2-DDC'))
-    speed: float = Field(default_factory=lambda: float(os.getenv('TTS_SPEED', '1.0')))
+    speed: float = Field(default_factory=lambda: _env_num('TTS_SPEED', 1.0, float))
     save_audio: bool = Field(default_factory=lambda: os.getenv('SAVE_AUDIO', 'true').lower() == 'true')
 
 class OSCConfig(BaseModel):
     ip: str = Field(default_factory=lambda: os.getenv('OSC_IP', '127.0.0.1'))
-    port: int = Field(default_factory=lambda: int(os.getenv('OSC_PORT', '5005')))
-    fps: int = Field(default_factory=lambda: int(os.getenv('OSC_FPS', '30')))
+    port: int = Field(default_factory=lambda: _env_num('OSC_PORT', 5005, int))
+    fps: int = Field(default_factory=lambda: _env_num('OSC_FPS', 30, int))
 
 class SystemConfig(BaseModel):
     debug: bool = Field(default_factory=lambda: os.getenv('DEBUG_MODE', 'true').lower() == 'true')
@@ -46,5 +51,10 @@ class SystemConfig(BaseModel):
         self.audio_output_dir.mkdir(parents=True, exist_ok=True)
         self.logs_dir.mkdir(parents=True, exist_ok=True)
 
+@lru_cache(maxsize=1)
+def get_config() -> SystemConfig:
+    """Build the system config once per process"""
+    return SystemConfig()
+
 # Global config instance
-config = SystemConfig()
+config = get_config()
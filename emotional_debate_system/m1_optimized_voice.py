@@ -7,20 +7,30 @@ import os
 import time
 import threading
 import queue
-from pathlib import Path
-from typing import List, Optional, Dict, Tuple
+from typing import List, Optional, Dict
 import warnings
 
 import torch
 import numpy as np
 import sounddevice as sd
-import soundfile as sf
 import psutil
-from chatterbox.tts import ChatterboxTTS
+
+from shared_chatterbox import GENERATE_LOCK, get_shared_model
 
 warnings.filterwarnings("ignore", category=UserWarning)
 
 
+def get_optimal_device(device: str = "auto") -> str:
+    """Determine the best device for M1 Max"""
+    if device == "auto":
+        if torch.backends.mps.is_available() and torch.backends.mps.is_built():
+            return "mps"
+        else:
+            print("⚠️  MPS not available, falling back to CPU")
+            return "cpu"
+    return device
+
+
 class M1OptimizedVoiceAgent:
     """
     M1 Max optimized voice agent with multiple performance strategies:
@@ -36,6 +46,8 @@ class M1OptimizedVoiceAgent:
         self.debater_name = debater_name
         self.device = self._get_optimal_device(device)
         self.model = None
+        self._conditioned_on: Optional[tuple] = None  # (path, mtime, size) of the sample
+        self._conds = None
         self.audio_cache: Dict[str, np.ndarray] = {}
         self.generation_queue = queue.Queue()
         
@@ -52,13 +64,7 @@ class M1OptimizedVoiceAgent:
 
     def _get_optimal_device(self, device: str) -> str:
         """Determine the best device for M1 Max"""
-        if device == "auto":
-            if torch.backends.mps.is_available() and torch.backends.mps.is_built():
-                return "mps"
-            else:
-                print("⚠️  MPS not available, falling back to CPU")
-                return "cpu"
-        return device
+        return get_optimal_device(device)
 
     def _setup_audio_settings(self):
         """Optimize audio settings for M1 Max"""
@@ -79,7 +85,7 @@ class M1OptimizedVoiceAgent:
             print("🔄 Loading Chatterbox TTS model...")
             start_time = time.time()
             
-            self.model = ChatterboxTTS.from_pretrained(device=self.device)
+            self.model = get_shared_model(self.device)
             
             load_time = time.time() - start_time
             print(f"✅ Model loaded in {load_time:.2f}s on {self.device}")
@@ -101,12 +107,13 @@ class M1OptimizedVoiceAgent:
             warmup_text = "Testing voice cloning."
             start_time = time.time()
             
-            _ = self.model.generate(
-                warmup_text,
-                audio_prompt_path=self.voice_sample_path,
-                temperature=0.6,
-                exaggeration=0.0,
-            )
+            with GENERATE_LOCK:
+                self._prepare_voice(self.voice_sample_path)
+                _ = self.model.generate(
+                    warmup_text,
+                    temperature=0.6,
+                    exaggeration=0.0,
+                )
             
             warmup_time = time.time() - start_time
             print(f"🔥 Model warmed up in {warmup_time:.2f}s")
@@ -114,6 +121,20 @@ class M1OptimizedVoiceAgent:
         except Exception as e:
             print(f"⚠️  Warmup failed (this is normal): {e}")
 
+    def _prepare_voice(self, voice_path: str):
+        """Condition the model on a voice sample once instead of on every generation
+        Call with GENERATE_LOCK held so no other agent re-conditions before generate"""
+        # Key on the file's mtime/size too, so a re-recorded sample is picked up
+        stat = os.stat(voice_path)
+        sample_key = (voice_path, stat.st_mtime_ns, stat.st_size)
+        if sample_key != self._conditioned_on:
+            self.model.prepare_conditionals(voice_path, exaggeration=0.0)
+            self._conditioned_on = sample_key
+            self._conds = self.model.conds
+        elif self.model.conds is not self._conds:
+            # Another agent has used the shared model since
+            self.model.conds = self._conds
+
     def generate_audio(self, text: str, voice_sample: Optional[str] = None) -> np.ndarray:
         """Generate audio using Chatterbox TTS with performance optimization"""
         if not self.model:
@@ -127,12 +148,13 @@ class M1OptimizedVoiceAgent:
         
         try:
             # Generate audio with optimal settings for speed
-            audio_tensor = self.model.generate(
-                text,
-                audio_prompt_path=voice_path,
-                temperature=0.6,      # Slightly lower for speed
-                exaggeration=0.0,     # Neutral is fastest
-            )
+            with GENERATE_LOCK:
+                self._prepare_voice(voice_path)
+                audio_tensor = self.model.generate(
+                    text,
+                    temperature=0.6,      # Slightly lower for speed
+                    exaggeration=0.0,     # Neutral is fastest
+                )
             
             # Convert to numpy array if needed
             if isinstance(audio_tensor, torch.Tensor):
@@ -337,6 +359,13 @@ class M1OptimizedVoiceAgent:
         
         self.audio_cache.clear()
         
+        # Drop the voice conditioning so the shared model keeps nothing of this sample
+        with GENERATE_LOCK:
+            if self.model is not None and self.model.conds is self._conds:
+                self.model.conds = None
+            self._conds = None
+            self._conditioned_on = None
+        
         # Clear queues
         while not self.generation_queue.empty():
             try:
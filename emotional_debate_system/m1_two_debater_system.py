@@ -5,8 +5,7 @@ Now with full MPS acceleration support on macOS 14+
 """
 
 import os
-import sys
-import platform
+import importlib.util
 import warnings
 from typing import Optional, Dict, List
 import numpy as np
@@ -14,16 +13,17 @@ from pathlib import Path
 import time
 import threading
 
+from shared_chatterbox import GENERATE_LOCK, get_shared_model
+
 # Suppress warnings
 warnings.filterwarnings("ignore")
 
-try:
-    from chatterbox import ChatterboxTTS
-    CHATTERBOX_AVAILABLE = True
-    print("✅ Chatterbox TTS loaded successfully!")
-except ImportError as e:
-    CHATTERBOX_AVAILABLE = False
-    print(f"❌ Chatterbox not available: {e}")
+# The model itself is loaded (and Chatterbox imported) by get_shared_model
+CHATTERBOX_AVAILABLE = importlib.util.find_spec("chatterbox") is not None
+if CHATTERBOX_AVAILABLE:
+    print("✅ Chatterbox TTS found!")
+else:
+    print("❌ Chatterbox not available: package 'chatterbox' is not installed")
 
 def get_device():
     """Get the best available device"""
@@ -47,6 +47,7 @@ class M1OptimizedVoiceDebater:
         self.model = None
         self.initialized = False
         self.generation_cache = {}
+        self._conds = None  # Voice conditioning, computed once from the sample
         
         print(f"🎭 Initializing {name} debater")
         print(f"   Voice sample: {voice_sample_path}")
@@ -64,7 +65,7 @@ class M1OptimizedVoiceDebater:
             
         try:
             print(f"🔄 {self.name}: Loading Chatterbox model on {self.device}...")
-            self.model = ChatterboxTTS.from_pretrained(device=self.device)
+            self.model = get_shared_model(self.device)
             print(f"✅ {self.name}: Model ready on {self.device}")
             self.initialized = True
             return True
@@ -122,7 +123,7 @@ class M1OptimizedVoiceDebater:
         
         # Play immediately if requested
         if play_immediately:
-            self._play_audio(audio, save_path or f"temp_{self.name}_{int(time.time())}.wav")
+            self._play_audio(audio)
             
         return audio
     
@@ -131,12 +132,18 @@ class M1OptimizedVoiceDebater:
         try:
             print(f"🎤 {self.name}: Generating '{text[:50]}...'")
             
-            audio = self.model.generate(
-                text=text,
-                audio_prompt_path=self.voice_sample_path,
-                temperature=0.6,
-                exaggeration=0.0
-            )
+            with GENERATE_LOCK:
+                if self._conds is None:
+                    self.model.prepare_conditionals(self.voice_sample_path, exaggeration=0.0)
+                    self._conds = self.model.conds
+                else:
+                    self.model.conds = self._conds
+                
+                audio = self.model.generate(
+                    text=text,
+                    temperature=0.6,
+                    exaggeration=0.0
+                )
             
             return audio
             
@@ -144,42 +151,34 @@ class M1OptimizedVoiceDebater:
             print(f"❌ {self.name}: Generation failed: {e}")
             return None
     
+    def _to_numpy(self, audio) -> np.ndarray:
+        """Convert generated audio to a flat numpy array"""
+        if hasattr(audio, 'numpy'):
+            audio_np = audio.detach().cpu().numpy()
+        else:
+            audio_np = np.asarray(audio)
+        
+        if audio_np.ndim > 1:
+            audio_np = audio_np.flatten()
+        return audio_np
+    
     def _save_audio(self, audio: np.ndarray, path: str):
         """Save audio to file"""
         try:
             import soundfile as sf
-            # Ensure audio is in the right format
-            if hasattr(audio, 'numpy'):
-                audio_np = audio.detach().cpu().numpy()
-            else:
-                audio_np = np.array(audio)
-            
-            if audio_np.ndim > 1:
-                audio_np = audio_np.flatten()
-                
-            sf.write(path, audio_np, 24000, format='WAV')
+            sf.write(path, self._to_numpy(audio), 24000, format='WAV')
             print(f"💾 {self.name}: Saved to {path}")
             
         except Exception as e:
             print(f"⚠️ {self.name}: Could not save audio: {e}")
     
-    def _play_audio(self, audio: np.ndarray, temp_path: str):
-        """Play audio using system audio"""
+    def _play_audio(self, audio: np.ndarray):
+        """Play audio straight from memory"""
         try:
-            # Save temporarily if needed
-            if not os.path.exists(temp_path):
-                self._save_audio(audio, temp_path)
-            
-            # Play using afplay (macOS)
-            os.system(f"afplay {temp_path}")
+            import sounddevice as sd
+            sd.play(self._to_numpy(audio), samplerate=24000)
+            sd.wait()
             
-            # Clean up temporary file if it was created
-            if temp_path.startswith("temp_"):
-                try:
-                    os.remove(temp_path)
-                except:
-                    pass
-                    
         except Exception as e:
             print(f"⚠️ {self.name}: Playback failed: {e}")
 
@@ -11,12 +11,14 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from config.config import config
+from config.config import get_config
 from llm.ollama_provider import OllamaLLM
 from emotion.detector import EmotionDetector
 from tts.coqui_provider import CoquiTTS
 from streaming.osc_streamer import OSCStreamer
 
+config = get_config()
+
 class DebateSystem:
     """Main debate orchestrator"""
     
@@ -50,7 +52,8 @@ class DebateSystem:
         self.osc = OSCStreamer(
             ip=config.osc.ip,
             port=config.osc.port,
-            fps=config.osc.fps
+            fps=config.osc.fps,
+            debug=config.debug
         )
         
         # Debate state
@@ -117,7 +120,7 @@ class DebateSystem:
                     self.debate_history.append({
                         'agent': agent_name,
                         'round': round_num + 1,
-                        'response': response.dict()
+                        'response': response.model_dump()
                     })
                     
                 except Exception as e:
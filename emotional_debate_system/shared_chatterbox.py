@@ -0,0 +1,27 @@
+"""
+Shared Chatterbox TTS model for the voice cloning scripts
+One model per device is loaded and reused by every agent/debater in the process
+"""
+
+import threading
+from typing import TYPE_CHECKING, Dict
+
+if TYPE_CHECKING:
+    from chatterbox.tts import ChatterboxTTS
+
+# Chatterbox models shared across the process, keyed by device
+_MODEL_CACHE: Dict[str, "ChatterboxTTS"] = {}
+_MODEL_LOCK = threading.Lock()
+
+# The shared model generates in whichever voice it was last conditioned on,
+# so conditioning + generate from different speakers must not interleave
+GENERATE_LOCK = threading.Lock()
+
+
+def get_shared_model(device: str) -> "ChatterboxTTS":
+    """Load the Chatterbox model once per device and reuse it"""
+    with _MODEL_LOCK:
+        if device not in _MODEL_CACHE:
+            from chatterbox.tts import ChatterboxTTS
+            _MODEL_CACHE[device] = ChatterboxTTS.from_pretrained(device=device)
+        return _MODEL_CACHE[device]
@@ -6,11 +6,10 @@ Alternative approach using stable TTS libraries that work well on M1 Max
 
 import os
 import sys
+import math
 import time
-import tempfile
 import warnings
 from pathlib import Path
-from typing import List, Optional, Dict
 import numpy as np
 
 # Check if we're on M1 Mac and have the right dependencies
@@ -96,24 +95,38 @@ class SimpleM1VoiceSystem:
         print("   3... 2... 1... Recording!")
         
         try:
-            # Record audio
-            audio_data = sd.rec(
-                int(duration * 22050),
-                samplerate=22050,
-                channels=1,
-                dtype=np.float32
-            )
+            # Record 16-bit PCM (the format it is stored in) block by block
+            # into one buffer, so the recording can be stopped early
+            total_frames = int(duration * 22050)
+            audio_data = np.empty((total_frames, 1), dtype=np.int16)
+            recorded = 0
             
-            # Countdown
-            for i in range(duration, 0, -1):
-                print(f"   {i}s remaining...", end='\r')
-                time.sleep(1)
+            def on_audio(indata, frames, time_info, status):
+                nonlocal recorded
+                n = min(frames, total_frames - recorded)
+                audio_data[recorded:recorded + n] = indata[:n]
+                recorded += n
+                if recorded >= total_frames:
+                    raise sd.CallbackStop
             
-            sd.wait()
+            with sd.InputStream(samplerate=22050, channels=1, dtype='int16',
+                                callback=on_audio) as stream:
+                try:
+                    # Countdown
+                    while stream.active:
+                        remaining = math.ceil((total_frames - recorded) / 22050)
+                        print(f"   {remaining}s remaining...", end='\r')
+                        time.sleep(0.1)
+                except KeyboardInterrupt:
+                    print("\n⏹️  Recording stopped early")
+            
+            if recorded == 0:
+                print("\n❌ No audio captured")
+                return False
             print(f"\n✅ Recording complete!")
             
             # Save audio
-            sf.write(filename, audio_data, 22050)
+            sf.write(filename, audio_data[:recorded], 22050, subtype='PCM_16')
             print(f"💾 Saved as: {filename}")
             
             return True
@@ -9,6 +9,12 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from llm.base import DebateResponse, EmotionMetadata
 
+POSITIVE_EMOTIONS = frozenset({'joy', 'amusement', 'excitement', 'gratitude', 'love',
+                               'optimism', 'caring', 'admiration', 'approval', 'pride', 'relief'})
+NEGATIVE_EMOTIONS = frozenset({'anger', 'annoyance', 'disappointment', 'sadness',
+                               'fear', 'nervousness', 'disgust', 'grief', 'remorse'})
+HIGH_AROUSAL_EMOTIONS = frozenset({'excitement', 'anger', 'fear', 'surprise', 'nervousness', 'amusement'})
+
 class EmotionDetector:
     """Emotion detection using transformers"""
     
@@ -66,13 +72,8 @@ class EmotionDetector:
     
     def _calculate_valence_from_emotions(self, emotions: List[EmotionMetadata]) -> float:
         """Calculate valence from detected emotions"""
-        positive_emotions = {'joy', 'amusement', 'excitement', 'gratitude', 'love', 
-                           'optimism', 'caring', 'admiration', 'approval', 'pride', 'relief'}
-        negative_emotions = {'anger', 'annoyance', 'disappointment', 'sadness', 
-                           'fear', 'nervousness', 'disgust', 'grief', 'remorse'}
-        
-        pos_score = sum(e.intensity for e in emotions if e.name in positive_emotions)
-        neg_score = sum(e.intensity for e in emotions if e.name in negative_emotions)
+        pos_score = sum(e.intensity for e in emotions if e.name in POSITIVE_EMOTIONS)
+        neg_score = sum(e.intensity for e in emotions if e.name in NEGATIVE_EMOTIONS)
         
         total = pos_score + neg_score
         if total == 0:
@@ -82,9 +83,7 @@ class EmotionDetector:
     
     def _calculate_arousal_from_emotions(self, emotions: List[EmotionMetadata]) -> float:
         """Calculate arousal from detected emotions"""
-        high_arousal = {'excitement', 'anger', 'fear', 'surprise', 'nervousness', 'amusement'}
-        
-        arousal_score = sum(e.intensity for e in emotions if e.name in high_arousal)
+        arousal_score = sum(e.intensity for e in emotions if e.name in HIGH_AROUSAL_EMOTIONS)
         total_score = sum(e.intensity for e in emotions)
         
         if total_score == 0:
@@ -2,6 +2,31 @@ import ollama
 from typing import List
 from .base import BaseLLM, DebateResponse, EmotionMetadata
 
+# Character-specific system prompts
+CHARACTER_PROMPTS = {
+    "worried": """You are a TRUTH SEEKER investigating shapeshifting lizard people. 
+            You are increasingly paranoid and see connections everywhere. Keep responses to 2-3 sentences.
+            Express concern, suspicion, and urgency in your language.""",
+    
+    "skeptical": """You are a SKEPTIC who thinks conspiracy theories about lizard people are nonsense.
+            You value evidence and logic. Keep responses to 2-3 sentences.
+            Express frustration with unfounded claims and demand proof."""
+}
+
+# Simple emotion detection based on keywords
+EMOTION_KEYWORDS = {
+    "worry": ("worry", "concern", "anxious", "nervous", "fear"),
+    "anger": ("angry", "mad", "furious", "outrage", "rage"),
+    "sadness": ("sad", "depressed", "disappointed", "grief"),
+    "joy": ("happy", "joy", "excited", "thrilled", "delighted"),
+    "surprise": ("surprised", "shocked", "amazed", "stunned"),
+    "disgust": ("disgusted", "revolted", "sickened", "repulsed")
+}
+
+POSITIVE_WORDS = ("good", "great", "excellent", "amazing", "wonderful", "fantastic", "love", "like", "enjoy")
+NEGATIVE_WORDS = ("bad", "terrible", "awful", "hate", "dislike", "horrible", "worst", "disgusting")
+HIGH_AROUSAL_WORDS = ("!", "excited", "urgent", "immediately", "now", "quickly", "fast", "rush")
+
 class OllamaLLM(BaseLLM):
     """Local Ollama LLM provider"""
     
@@ -9,6 +34,10 @@ class OllamaLLM(BaseLLM):
         self.model = model
         self.host = host
         self.client = ollama.Client(host=host)
+        self.options = {
+            'temperature': 0.7,
+            'num_predict': 150,
+        }
     
     def generate_with_emotion(self, prompt: str, character: str = "skeptical") -> DebateResponse:
         """Generate debate response with emotion inference"""
@@ -22,10 +51,7 @@ class OllamaLLM(BaseLLM):
                 {'role': 'system', 'content': system_prompt},
                 {'role': 'user', 'content': prompt}
             ],
-            options={
-                'temperature': 0.7,
-                'num_predict': 150,
-            }
+            options=self.options
         )
         
         text = response['message']['content'].strip()
@@ -44,33 +70,14 @@ class OllamaLLM(BaseLLM):
     
     def _get_character_prompt(self, character: str) -> str:
         """Get character-specific system prompt"""
-        prompts = {
-            "worried": """You are a TRUTH SEEKER investigating shapeshifting lizard people. 
-            You are increasingly paranoid and see connections everywhere. Keep responses to 2-3 sentences.
-            Express concern, suspicion, and urgency in your language.""",
-            
-            "skeptical": """You are a SKEPTIC who thinks conspiracy theories about lizard people are nonsense.
-            You value evidence and logic. Keep responses to 2-3 sentences.
-            Express frustration with unfounded claims and demand proof."""
-        }
-        return prompts.get(character, prompts["skeptical"])
+        return CHARACTER_PROMPTS.get(character, CHARACTER_PROMPTS["skeptical"])
     
     def _infer_basic_emotions(self, text: str) -> List[EmotionMetadata]:
         """Infer basic emotions from text using simple heuristics"""
         emotions = []
         text_lower = text.lower()
         
-        # Simple emotion detection based on keywords
-        emotion_keywords = {
-            "worry": ["worry", "concern", "anxious", "nervous", "fear"],
-            "anger": ["angry", "mad", "furious", "outrage", "rage"],
-            "sadness": ["sad", "depressed", "disappointed", "grief"],
-            "joy": ["happy", "joy", "excited", "thrilled", "delighted"],
-            "surprise": ["surprised", "shocked", "amazed", "stunned"],
-            "disgust": ["disgusted", "revolted", "sickened", "repulsed"]
-        }
-        
-        for emotion, keywords in emotion_keywords.items():
+        for emotion, keywords in EMOTION_KEYWORDS.items():
             intensity = sum(1 for keyword in keywords if keyword in text_lower) / len(keywords)
             if intensity > 0:
                 emotions.append(EmotionMetadata(
@@ -85,12 +92,9 @@ class OllamaLLM(BaseLLM):
     
     def _calculate_valence(self, text: str) -> float:
         """Calculate valence (positive/negative) from text"""
-        positive_words = ["good", "great", "excellent", "amazing", "wonderful", "fantastic", "love", "like", "enjoy"]
-        negative_words = ["bad", "terrible", "awful", "hate", "dislike", "horrible", "worst", "disgusting"]
-        
         text_lower = text.lower()
-        pos_count = sum(1 for word in positive_words if word in text_lower)
-        neg_count = sum(1 for word in negative_words if word in text_lower)
+        pos_count = sum(1 for word in POSITIVE_WORDS if word in text_lower)
+        neg_count = sum(1 for word in NEGATIVE_WORDS if word in text_lower)
         
         total = pos_count + neg_count
         if total == 0:
@@ -100,10 +104,9 @@ class OllamaLLM(BaseLLM):
     
     def _calculate_arousal(self, text: str) -> float:
         """Calculate arousal (calm/excited) from text"""
-        high_arousal_words = ["!", "excited", "urgent", "immediately", "now", "quickly", "fast", "rush"]
         text_lower = text.lower()
         
-        arousal_score = sum(1 for word in high_arousal_words if word in text_lower)
+        arousal_score = sum(1 for word in HIGH_AROUSAL_WORDS if word in text_lower)
         arousal_score += text.count("!") * 0.5  # Exclamation marks
         
         return min(arousal_score / 5.0, 1.0)  # Normalize to 0-1
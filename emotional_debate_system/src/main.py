@@ -13,13 +13,15 @@ sys.path.insert(0, str(Path(__file__).parent))
 # Add parent directory to path for config
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from config.config import config
+from config.config import get_config
 from llm.ollama_provider import OllamaLLM
 from emotion.detector import EmotionDetector
 from tts.coqui_provider import CoquiTTS
 from tts.macos_provider import MacOSTTS
 from streaming.osc_streamer import OSCStreamer
 
+config = get_config()
+
 class DebateSystem:
     """Main debate orchestrator"""
     
@@ -62,7 +64,8 @@ class DebateSystem:
         self.osc = OSCStreamer(
             ip=config.osc.ip,
             port=config.osc.port,
-            fps=config.osc.fps
+            fps=config.osc.fps,
+            debug=config.debug
         )
         
         # Debate state
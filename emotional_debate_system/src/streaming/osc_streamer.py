@@ -1,6 +1,6 @@
-from pythonosc import udp_client
+from pythonosc import udp_client, osc_bundle_builder, osc_message_builder
 import time
-from typing import Dict
+from typing import Any, Dict, List, Tuple
 import sys
 from pathlib import Path
 
@@ -10,36 +10,68 @@ from llm.base import DebateResponse
 class OSCStreamer:
     """Stream emotion data via OSC to TouchDesigner"""
     
-    def __init__(self, ip: str = "127.0.0.1", port: int = 5005, fps: int = 30):
+    def __init__(self, ip: str = "127.0.0.1", port: int = 5005, fps: int = 30, debug: bool = False):
         self.client = udp_client.SimpleUDPClient(ip, port)
         self.fps = fps
         self.frame_time = 1.0 / fps
+        self.debug = debug
+        self._addresses: Dict[str, Dict[str, str]] = {}
         print(f"📡 OSC streaming to {ip}:{port} @ {fps} FPS")
     
+    def _agent_addresses(self, agent_name: str) -> Dict[str, str]:
+        """Build the fixed OSC addresses for an agent once and reuse them"""
+        addresses = self._addresses.get(agent_name)
+        if addresses is None:
+            addresses = {
+                'emotion': f"/{agent_name}/emotion/",
+                'valence': f"/{agent_name}/valence",
+                'arousal': f"/{agent_name}/arousal",
+                'primary_emotion': f"/{agent_name}/primary_emotion",
+            }
+            self._addresses[agent_name] = addresses
+        return addresses
+    
+    def _send_bundle(self, messages: List[Tuple[str, Any]]):
+        """Send several messages as one OSC bundle (a single UDP datagram)"""
+        if not messages:
+            return
+        bundle = osc_bundle_builder.OscBundleBuilder(osc_bundle_builder.IMMEDIATELY)
+        for address, value in messages:
+            msg = osc_message_builder.OscMessageBuilder(address=address)
+            msg.add_arg(value)
+            bundle.add_content(msg.build())
+        self.client.send(bundle.build())
+    
     def stream_debate_response(self, debate_response: DebateResponse, agent_name: str = "agent"):
         """Stream all emotion parameters"""
+        addresses = self._agent_addresses(agent_name)
+        
+        # Primary emotions (top 5)
+        messages = [
+            (addresses['emotion'] + emotion.name, float(emotion.intensity))
+            for emotion in debate_response.emotions[:5]
+        ]
         
-        # Stream primary emotions (top 5)
-        for emotion in debate_response.emotions[:5]:
-            address = f"/{agent_name}/emotion/{emotion.name}"
-            self.client.send_message(address, float(emotion.intensity))
+        # Dimensional values
+        messages.append((addresses['valence'], float(debate_response.valence)))
+        messages.append((addresses['arousal'], float(debate_response.arousal)))
         
-        # Stream dimensional values
-        self.client.send_message(f"/{agent_name}/valence", float(debate_response.valence))
-        self.client.send_message(f"/{agent_name}/arousal", float(debate_response.arousal))
+        # Metadata
+        messages.append((addresses['primary_emotion'], debate_response.primary_emotion))
         
-        # Stream metadata
-        self.client.send_message(f"/{agent_name}/primary_emotion", debate_response.primary_emotion)
+        self._send_bundle(messages)
         
-        if hasattr(self, 'debug') and self.debug:
+        if self.debug:
             print(f"  📤 Streamed to /{agent_name}/* via OSC")
     
     def stream_continuous(self, emotion_dict: Dict[str, float], agent_name: str = "agent"):
         """Stream emotion updates at consistent FPS"""
         start_time = time.time()
         
-        for key, value in emotion_dict.items():
-            self.client.send_message(f"/{agent_name}/{key}", float(value))
+        self._send_bundle([
+            (f"/{agent_name}/{key}", float(value))
+            for key, value in emotion_dict.items()
+        ])
         
         # Maintain timing
         elapsed = time.time() - start_time